@@ -9,17 +9,29 @@ This package provides utilities for:
 
 # Import core components
 # Import AWS components
-from .aws import extract_jdbc_from_glue, get_engine_from_glue, list_glue_connections
-from .core import JDBCConnectionError, get_sqlalchemy_url, parse_jdbc_url
+from .aws import (
+    clear_glue_cache,
+    extract_jdbc_from_glue,
+    get_engine_from_glue,
+    list_glue_connections,
+    list_glue_connections_list,
+)
+from .core import JDBCConn, JDBCConnectionError, get_sqlalchemy_url, parse_jdbc_url
 
 # Import database components
 from .database import (
     execute_query,
+    get_many_table_schemas,
     get_table_sample,
     get_table_schema,
     get_table_stats,
+    invalidate_metadata_cache,
+    iter_query,
+    iter_table,
     list_schemas,
     list_tables,
+    prefetch_table_schemas,
+    read_sql_fast,
     read_sql_with_polars,
     read_table,
 )
@@ -29,19 +41,28 @@ __all__ = [
     "parse_jdbc_url",
     "get_sqlalchemy_url",
     "JDBCConnectionError",
+    "JDBCConn",
     # AWS
     "list_glue_connections",
+    "list_glue_connections_list",
     "extract_jdbc_from_glue",
     "get_engine_from_glue",
+    "clear_glue_cache",
     # Database
     "list_schemas",
     "list_tables",
     "get_table_schema",
+    "get_many_table_schemas",
     "get_table_sample",
     "read_table",
     "execute_query",
+    "iter_table",
+    "iter_query",
     "get_table_stats",
     "read_sql_with_polars",
+    "read_sql_fast",
+    "prefetch_table_schemas",
+    "invalidate_metadata_cache",
 ]
 
 __version__ = "0.1.0"
@@ -5,44 +5,122 @@ This module provides functions to interact with AWS services, particularly
 for retrieving connection details from AWS Glue connections.
 """
 
-from typing import Any, Dict, List, Optional
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import boto3
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 from sqlalchemy import create_engine
 
-from .core import JDBCConnectionError, get_sqlalchemy_url, parse_jdbc_url
+from .core import JDBCConn, JDBCConnectionError, get_sqlalchemy_url, parse_jdbc_url
+
+# TTL (in seconds) for cached Glue connection details and engines.
+# Overridable via the PJT_GLUE_CACHE_TTL environment variable.
+GLUE_CACHE_TTL = int(os.environ.get("PJT_GLUE_CACHE_TTL", 600))
+
+# Caches storing (value, monotonic_ts). JDBC details are keyed by
+# (connection_name, region_name); engines additionally key on the pool
+# settings so different tuning never serves a stale engine.
+_jdbc_cache: Dict[Tuple[str, Optional[str]], Tuple[Dict[str, Any], float]] = {}
+_engine_cache: Dict[Tuple[Any, ...], Tuple[Any, float]] = {}
+
+# Glue clients keyed by region; client construction parses the service model
+# and builds signers, so it's worth amortizing. boto3 clients are thread-safe.
+_glue_clients: Dict[Optional[str], Any] = {}
+_glue_clients_lock = threading.Lock()
+
+# Glue throttles aggressively: adaptive retry mode paces requests to the
+# observed throttle rate instead of the legacy mode's long back-off tails,
+# and the larger connection pool lets bursts of calls proceed concurrently.
+_GLUE_CLIENT_CONFIG = Config(
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    max_pool_connections=32,
+    tcp_keepalive=True,
+)
+
+
+def _glue_client(region_name: Optional[str] = None):
+    """Return a cached Glue client for a region, creating it on first use."""
+    with _glue_clients_lock:
+        client = _glue_clients.get(region_name)
+        if client is None:
+            client = _glue_clients[region_name] = boto3.client(
+                "glue", region_name=region_name, config=_GLUE_CLIENT_CONFIG
+            )
+        return client
+
 
+def clear_glue_cache() -> None:
+    """
+    Clear the cached Glue connection details and engines.
 
-def list_glue_connections(region_name=None) -> List[str]:
+    Cached engines are disposed so their pooled connections are released.
+    Mainly useful in tests or after rotating connection credentials.
     """
-    List all AWS Glue connection names in a region.
+    _jdbc_cache.clear()
+    for engine, _ in _engine_cache.values():
+        engine.dispose()
+    _engine_cache.clear()
+
+
+def list_glue_connections(region_name=None, page_size: int = 1000) -> Iterator[str]:
+    """
+    Lazily iterate over all AWS Glue connection names in a region.
+
+    Names are yielded as each Glue page arrives, so callers can start
+    processing after the first page and memory stays bounded by the page
+    size regardless of how many connections exist in the catalog.
 
     Args:
         region_name (str, optional): AWS region name. If None, uses default from AWS config.
+        page_size (int): Number of connections requested per Glue API call.
+            Defaults to 1000 (Glue's maximum) to minimize HTTPS round-trips;
+            lower it for heavily rate-limited accounts.
 
     Returns:
-        List[str]: List of connection names
+        Iterator[str]: Iterator of connection names
 
     Raises:
         JDBCConnectionError: If there's an error communicating with AWS Glue
     """
     try:
-        # Initialize Glue client
-        glue_client = boto3.client("glue", region_name=region_name)
+        glue_client = _glue_client(region_name)
 
-        # Get list of connections (paginated results)
-        connection_names = []
+        # Stream connection names page by page. Only names are needed, so
+        # ask Glue to omit credentials (HidePassword) and project the names
+        # out with JMESPath instead of building per-connection dicts.
         paginator = glue_client.get_paginator("get_connections")
+        yield from paginator.paginate(
+            HidePassword=True,
+            PaginationConfig={"PageSize": page_size},
+        ).search("ConnectionList[].Name")
 
-        for page in paginator.paginate():
-            # Extract just the names from each connection
-            names = [conn.get("Name") for conn in page.get("ConnectionList", [])]
-            connection_names.extend(names)
+    except (BotoCoreError, ClientError) as e:
+        # Chain the boto3 error so callers can inspect the error code
+        # (ThrottlingException vs. AccessDenied) instead of parsing strings
+        raise JDBCConnectionError("Error listing Glue connections") from e
 
-        return connection_names
 
-    except Exception as e:
-        raise JDBCConnectionError(f"Error listing connections: {str(e)}")
+def list_glue_connections_list(region_name=None) -> List[str]:
+    """
+    List all AWS Glue connection names in a region as a materialized list.
+
+    Thin wrapper around :func:`list_glue_connections` for callers that
+    truly need a list (e.g. to index or len() the result).
+
+    Args:
+        region_name (str, optional): AWS region name. If None, uses default from AWS config.
+
+    Returns:
+        List[str]: List of connection names
+
+    Raises:
+        JDBCConnectionError: If there's an error communicating with AWS Glue
+    """
+    return list(list_glue_connections(region_name=region_name))
 
 
 def extract_jdbc_from_glue(
@@ -62,67 +140,133 @@ def extract_jdbc_from_glue(
     Raises:
         JDBCConnectionError: If the connection doesn't exist, is not a JDBC connection,
                              or there's an error communicating with AWS Glue
+
+    Note:
+        Results are cached for GLUE_CACHE_TTL seconds (default 600, override
+        with the PJT_GLUE_CACHE_TTL environment variable) so repeated calls
+        for the same connection skip the Glue API round-trip. Call
+        clear_glue_cache() to force a refresh.
     """
+    cache_key = (connection_name, region_name)
+    cached = _jdbc_cache.get(cache_key)
+    if cached is not None:
+        details, ts = cached
+        if time.monotonic() - ts < GLUE_CACHE_TTL:
+            # Return a JDBCConn copy (matching the cache-miss path) so
+            # attribute access keeps working on hits; the nested
+            # additional_params dict is copied too so mutating it can't
+            # poison the cache entry
+            result = JDBCConn(details)
+            result["additional_params"] = dict(details.get("additional_params", {}))
+            return result
+        del _jdbc_cache[cache_key]
+
+    # Only the Glue API call is wrapped; validation below raises
+    # JDBCConnectionError directly without re-wrapping
     try:
-        # Initialize Glue client
-        glue_client = boto3.client("glue", region_name=region_name)
-
-        # Get connection details
+        glue_client = _glue_client(region_name)
         response = glue_client.get_connection(Name=connection_name)
-
-        # Check if connection exists
-        if "Connection" not in response:
-            raise JDBCConnectionError(f"Connection '{connection_name}' not found")
-
-        connection = response["Connection"]
-        connection_properties = connection.get("ConnectionProperties", {})
-
-        # Check if it's a JDBC connection
-        if "JDBC_CONNECTION_URL" not in connection_properties:
-            raise JDBCConnectionError(
-                f"Connection '{connection_name}' is not a JDBC connection"
-            )
-
-        # Extract JDBC URL
-        jdbc_url = connection_properties["JDBC_CONNECTION_URL"]
-
-        # Check if it's a valid JDBC URL
-        if not jdbc_url.startswith("jdbc:"):
-            raise JDBCConnectionError(f"Invalid JDBC URL format: {jdbc_url}")
-
-        # Get username and password
-        username = connection_properties.get("USERNAME", "")
-        password = connection_properties.get("PASSWORD", "")
-
-        # Parse connection details based on database type
-        connection_details = parse_jdbc_url(jdbc_url)
-        connection_details["user"] = username
-        connection_details["password"] = password
-        connection_details["jdbc_url"] = jdbc_url
-        connection_details["connection_name"] = connection.get("Name", "")
-
-        return connection_details
-
     except Exception as e:
-        if isinstance(e, JDBCConnectionError):
-            raise
-        raise JDBCConnectionError(f"Error extracting JDBC details: {str(e)}")
-
-
-def get_engine_from_glue(connection_name: str, region_name: Optional[str] = None):
+        raise JDBCConnectionError(f"Error extracting JDBC details: {str(e)}") from e
+
+    # Check if connection exists
+    if "Connection" not in response:
+        raise JDBCConnectionError(f"Connection '{connection_name}' not found")
+
+    connection = response["Connection"]
+    connection_properties = connection.get("ConnectionProperties", {})
+
+    # Check if it's a JDBC connection
+    if "JDBC_CONNECTION_URL" not in connection_properties:
+        raise JDBCConnectionError(
+            f"Connection '{connection_name}' is not a JDBC connection"
+        )
+
+    # Extract JDBC URL
+    jdbc_url = connection_properties["JDBC_CONNECTION_URL"]
+
+    # Check if it's a valid JDBC URL
+    if not jdbc_url.startswith("jdbc:"):
+        raise JDBCConnectionError(f"Invalid JDBC URL format: {jdbc_url}")
+
+    # Get username and password
+    username = connection_properties.get("USERNAME", "")
+    password = connection_properties.get("PASSWORD", "")
+
+    # Parse connection details based on database type
+    connection_details = parse_jdbc_url(jdbc_url)
+    connection_details["user"] = username
+    connection_details["password"] = password
+    connection_details["jdbc_url"] = jdbc_url
+    connection_details["connection_name"] = connection.get("Name", "")
+
+    cache_entry = dict(connection_details)
+    cache_entry["additional_params"] = dict(
+        connection_details.get("additional_params", {})
+    )
+    _jdbc_cache[cache_key] = (cache_entry, time.monotonic())
+
+    return connection_details
+
+
+def get_engine_from_glue(
+    connection_name: str,
+    region_name: Optional[str] = None,
+    pool_size: int = 10,
+    max_overflow: int = 20,
+    pool_pre_ping: bool = True,
+    pool_recycle: int = 1800,
+):
     """
     Create a SQLAlchemy engine from a Glue connection name.
 
     Args:
         connection_name (str): Glue connection name
         region_name (str, optional): AWS region name
+        pool_size (int): Connections kept open in the pool. The default is
+            sized for the parallel metadata helpers and streaming reads.
+        max_overflow (int): Extra connections allowed beyond pool_size
+        pool_pre_ping (bool): Test connections on checkout so idle-dropped
+            connections are replaced instead of failing the first query
+        pool_recycle (int): Recycle connections older than this many seconds
 
     Returns:
         Engine: SQLAlchemy engine
 
     Raises:
-        JDBCConnectionError: If there's an error getting the connection details or creating the engine
+        JDBCConnectionError: If there's an error getting the connection details
+            or creating the engine
+
+    Note:
+        Engines are cached for GLUE_CACHE_TTL seconds per (connection_name,
+        region_name, pool settings) so repeated queries reuse the same
+        connection pool; calling with different pool parameters builds a
+        separate engine. Expired engines are disposed on eviction.
     """
+    cache_key = (
+        connection_name,
+        region_name,
+        pool_size,
+        max_overflow,
+        pool_pre_ping,
+        pool_recycle,
+    )
+    cached = _engine_cache.get(cache_key)
+    if cached is not None:
+        engine, ts = cached
+        if time.monotonic() - ts < GLUE_CACHE_TTL:
+            return engine
+        del _engine_cache[cache_key]
+        engine.dispose()
+
     conn_details = extract_jdbc_from_glue(connection_name, region_name)
     conn_url = get_sqlalchemy_url(conn_details)
-    return create_engine(conn_url)
+    engine = create_engine(
+        conn_url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=pool_pre_ping,
+        pool_recycle=pool_recycle,
+    )
+    _engine_cache[cache_key] = (engine, time.monotonic())
+    return engine
@@ -5,8 +5,22 @@ This module provides pure functions for parsing and generating JDBC and SQLAlche
 without any dependencies on external services or libraries (except standard library).
 """
 
-from typing import Any, Dict
-from urllib.parse import parse_qs, quote_plus, urlparse
+import functools
+from typing import Any, Dict, Final
+from urllib.parse import parse_qsl, quote_plus, urlparse
+
+# Default ports per normalized connection type
+_DEFAULT_PORTS: Final[Dict[str, int]] = {
+    "postgresql": 5432,
+    "redshift": 5439,
+    "sqlserver": 1433,
+}
+
+
+# Error-message templates hoisted as module constants; formatting happens
+# only at raise time, keeping the success path free of f-string work
+_ERR_INVALID_URL: Final[str] = "Invalid JDBC URL format: {}"
+_ERR_UNSUPPORTED: Final[str] = "Unsupported database type: {}"
 
 
 class JDBCConnectionError(Exception):
@@ -15,90 +29,234 @@ class JDBCConnectionError(Exception):
     pass
 
 
+class JDBCConn(dict):
+    """
+    Parsed JDBC connection details.
+
+    A dict (so existing mapping-style access, mutation and iteration keep
+    working) that also exposes its fields as attributes: ``conn.host`` is
+    equivalent to ``conn["host"]``. The empty __slots__ keeps instances from
+    growing a per-object __dict__ on attribute assignment.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self[name] = value
+
+
 def parse_jdbc_url(jdbc_url: str) -> Dict[str, Any]:
     """
     Parse different types of JDBC URLs to extract connection details.
 
+    Results are memoized per URL (applications tend to reuse a small set of
+    connection strings, e.g. across pool reconnects), so repeated calls skip
+    the parsing work. Each call returns a fresh dict that callers may mutate.
+
     Args:
         jdbc_url (str): JDBC connection URL
 
     Returns:
-        dict: Dictionary with connection details (connection_type, host, port, database)
+        JDBCConn: Connection details (connection_type, host, port, database),
+            accessible both as mapping keys and as attributes
 
     Raises:
         JDBCConnectionError: If the URL format is invalid or the database type is unsupported
     """
-    # Extract connection type and URL part
-    jdbc_parts = jdbc_url.split(":", 2)
-    if len(jdbc_parts) < 3:
-        raise JDBCConnectionError(f"Invalid JDBC URL format: {jdbc_url}")
+    cached = _parse_jdbc_url_cached(jdbc_url)
+    result = JDBCConn(cached)
+    result["additional_params"] = dict(cached["additional_params"])
+    return result
 
-    connection_type = jdbc_parts[1].lower()
-    url_part = jdbc_parts[2]
 
-    # Remove leading slashes
-    while url_part.startswith("/"):
-        url_part = url_part[1:]
+def _split_authority(url_part: str):
+    """
+    Split ``host[:port][/path][?query]`` into (host, port, path, query).
+
+    JDBC URL parts have no scheme, userinfo or fragment, so a couple of
+    C-level string splits do the job without the allocations of a full
+    urlparse round-trip. IPv6 authorities (``[...]``) fall back to urlparse.
 
-    result = {
+    Returns:
+        tuple: (host or None, port or None, path, query)
+    """
+    authority, _, rest = url_part.partition("/")
+    path, _, query = rest.partition("?")
+    if "?" in authority:
+        # Query string with no path component, e.g. host:5432?sslmode=require
+        authority, _, query = authority.partition("?")
+
+    if authority.startswith("["):
+        # IPv6 literal; urlparse handles the bracket/port rules
+        parsed = urlparse(f"http://{url_part}")
+        try:
+            port = parsed.port
+        except ValueError:
+            raise JDBCConnectionError(_ERR_INVALID_URL.format(url_part)) from None
+        return parsed.hostname, port, parsed.path.lstrip("/"), parsed.query
+
+    host, sep, port_str = authority.rpartition(":")
+    if not sep:
+        return authority.lower() or None, None, path, query
+    try:
+        # Malformed ports surface as the library's typed error, keeping
+        # parse_jdbc_url's documented Raises contract
+        port = int(port_str) if port_str else None
+    except ValueError:
+        raise JDBCConnectionError(_ERR_INVALID_URL.format(url_part)) from None
+    return host.lower() or None, port, path, query
+
+
+def _parse_host_port_db(
+    url_part: str, connection_type: str, default_port: int
+) -> Dict[str, Any]:
+    """Parse a host:port/database?params URL part (PostgreSQL/Redshift style)."""
+    # Format: jdbc:postgresql://host:port/database or jdbc:redshift://host:port/database
+    host, port, path, query = _split_authority(url_part)
+    return {
         "connection_type": connection_type,
-        "host": None,
-        "port": None,
-        "database": None,
-        "additional_params": {},
+        "host": host,
+        "port": port or default_port,
+        "database": path.strip("/"),
+        # parse_qsl gives flat string values (last value wins, matching JDBC
+        # driver behavior) instead of parse_qs's one-element lists
+        "additional_params": (
+            dict(parse_qsl(query, keep_blank_values=True)) if query else {}
+        ),
     }
 
-    # Parse based on connection type
-    if connection_type == "postgresql" or connection_type == "redshift":
-        # Format: jdbc:postgresql://host:port/database or jdbc:redshift://host:port/database
-        parsed_url = urlparse(f"http://{url_part}")
-        result["host"] = parsed_url.hostname
-        result["port"] = parsed_url.port or (
-            5432 if connection_type == "postgresql" else 5439
-        )
-        result["database"] = parsed_url.path.strip("/")
-
-        # Parse query parameters
-        if parsed_url.query:
-            result["additional_params"] = parse_qs(parsed_url.query)
-
-    elif connection_type == "sqlserver" or connection_type == "microsoft:sqlserver":
-        # Format: jdbc:sqlserver://host:port;databaseName=database;property=value
-        if connection_type == "microsoft:sqlserver":
-            result["connection_type"] = "sqlserver"  # Normalize the type
-
-        # Split host:port from properties
-        if ";" in url_part:
-            server_part, properties = url_part.split(";", 1)
-        else:
-            server_part, properties = url_part, ""
-
-        # Parse host and port
-        parsed_server = urlparse(f"http://{server_part}")
-        result["host"] = parsed_server.hostname
-        result["port"] = parsed_server.port or 1433  # Default SQL Server port
-
-        # Parse properties (databaseName, etc.)
-        properties_dict = {}
-        for prop in properties.split(";"):
-            if prop and "=" in prop:
-                key, value = prop.split("=", 1)
-                properties_dict[key.strip()] = value.strip()
-
-        # Extract database name
-        result["database"] = properties_dict.get("databaseName", "")
-        result["additional_params"] = properties_dict
 
+def _parse_sqlserver(url_part: str) -> Dict[str, Any]:
+    """Parse a host:port;key=value URL part (SQL Server style)."""
+    # Format: jdbc:sqlserver://host:port;databaseName=database;property=value
+    # Split host:port from properties
+    if ";" in url_part:
+        server_part, properties = url_part.split(";", 1)
     else:
-        raise JDBCConnectionError(f"Unsupported database type: {connection_type}")
+        server_part, properties = url_part, ""
 
-    return result
+    # Parse host and port
+    host, port, _, _ = _split_authority(server_part)
+
+    # Parse properties (databaseName, etc.); partition returns an empty
+    # separator for segments without '=', which the filter skips
+    properties_dict = {
+        key.strip(): value.strip()
+        for key, sep, value in (prop.partition("=") for prop in properties.split(";"))
+        if sep
+    }
+
+    return {
+        "connection_type": "sqlserver",  # Normalized type
+        "host": host,
+        "port": port or _DEFAULT_PORTS["sqlserver"],
+        "database": properties_dict.get("databaseName", ""),
+        "additional_params": properties_dict,
+    }
+
+
+# Supported URL prefixes in match order (the longer microsoft: alias must
+# precede the bare sqlserver: prefix), mapped to normalized types. One
+# startswith scan both validates the scheme and picks the parser.
+_JDBC_PREFIX_TO_TYPE = (
+    ("jdbc:postgresql:", "postgresql"),
+    ("jdbc:redshift:", "redshift"),
+    ("jdbc:microsoft:sqlserver:", "sqlserver"),
+    ("jdbc:sqlserver:", "sqlserver"),
+)
+
+# Dispatch tables built at import time: O(1) lookup instead of re-running
+# the string comparisons of an if/elif ladder on every call
+_JDBC_PARSERS = {
+    "postgresql": functools.partial(
+        _parse_host_port_db,
+        connection_type="postgresql",
+        default_port=_DEFAULT_PORTS["postgresql"],
+    ),
+    "redshift": functools.partial(
+        _parse_host_port_db,
+        connection_type="redshift",
+        default_port=_DEFAULT_PORTS["redshift"],
+    ),
+    "sqlserver": _parse_sqlserver,
+    "microsoft:sqlserver": _parse_sqlserver,
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_jdbc_url_cached(jdbc_url: str) -> Dict[str, Any]:
+    """Parse a JDBC URL; memoized (errors are raised without being cached)."""
+    # Fast path: one startswith scan validates the scheme and selects the
+    # parser without allocating a split list
+    for prefix, connection_type in _JDBC_PREFIX_TO_TYPE:
+        if jdbc_url.startswith(prefix):
+            return _JDBC_PARSERS[connection_type](jdbc_url[len(prefix):].lstrip("/"))
+
+    # Slow path for mixed-case schemes; also produces the right error for
+    # malformed or unsupported URLs
+    jdbc_parts = jdbc_url.split(":", 2)
+    if len(jdbc_parts) < 3:
+        raise JDBCConnectionError(_ERR_INVALID_URL.format(jdbc_url))
+
+    connection_type = jdbc_parts[1].lower()
+    url_part = jdbc_parts[2].lstrip("/")
+
+    parser = _JDBC_PARSERS.get(connection_type)
+    if parser is None:
+        raise JDBCConnectionError(_ERR_UNSUPPORTED.format(connection_type))
+
+    return parser(url_part)
+
+
+def _build_postgresql_url(auth_host: str, database: str, driver) -> str:
+    return f"postgresql://{auth_host}/{database}"
+
+
+def _build_redshift_url(auth_host: str, database: str, driver) -> str:
+    # Redshift uses PostgreSQL dialect
+    return f"postgresql+psycopg2://{auth_host}/{database}"
+
+
+def _build_sqlserver_url(auth_host: str, database: str, driver) -> str:
+    # For SQL Server, use pyodbc with appropriate driver
+    driver_quoted = quote_plus(driver or "ODBC Driver 17 for SQL Server")
+    return f"mssql+pyodbc://{auth_host}/{database}?driver={driver_quoted}"
+
+
+_SQLA_BUILDERS = {
+    "postgresql": _build_postgresql_url,
+    "redshift": _build_redshift_url,
+    "sqlserver": _build_sqlserver_url,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _sqla_url(conn_type, host, port, database, user, password, driver) -> str:
+    """Assemble a SQLAlchemy URL; memoized on the full input tuple."""
+    builder = _SQLA_BUILDERS.get(conn_type)
+    if builder is None:
+        raise JDBCConnectionError(_ERR_UNSUPPORTED.format(conn_type))
+
+    # Quote the password for URL safety
+    quoted_password = quote_plus(password) if password else ""
+
+    return builder(f"{user}:{quoted_password}@{host}:{port}", database, driver)
 
 
 def get_sqlalchemy_url(conn_details: Dict[str, Any]) -> str:
     """
     Generate a SQLAlchemy connection URL from connection details.
 
+    URLs are pure functions of their inputs, so results are memoized on the
+    (type, host, port, database, user, password, driver) tuple — repeated
+    lookups for the same connection skip the quoting and string assembly.
+
     Args:
         conn_details (dict): Connection details dictionary
 
@@ -108,38 +266,17 @@ def get_sqlalchemy_url(conn_details: Dict[str, Any]) -> str:
     Raises:
         JDBCConnectionError: If the database type is unsupported
     """
-    conn_type = conn_details.get("connection_type", "")
-    host = conn_details.get("host", "")
-    port = conn_details.get("port", "")
-    database = conn_details.get("database", "")
-    user = conn_details.get("user", "")
-    password = conn_details.get("password", "")
-
-    # Quote the password for URL safety
-    quoted_password = quote_plus(password) if password else ""
-
-    # Handle different database types
-    if conn_type == "postgresql":
-        return f"postgresql://{user}:{quoted_password}@{host}:{port}/{database}"
-
-    elif conn_type == "redshift":
-        # Redshift uses PostgreSQL dialect
-        return (
-            f"postgresql+psycopg2://{user}:{quoted_password}@{host}:{port}/{database}"
-        )
-
-    elif conn_type == "sqlserver":
-        # For SQL Server, use pyodbc with appropriate driver
-        # First, build the base connection string
-        conn_str = f"mssql+pyodbc://{user}:{quoted_password}@{host}:{port}/{database}"
-
-        # Add driver information
-        additional_params = conn_details.get("additional_params", {})
-        driver = additional_params.get("driver", "ODBC Driver 17 for SQL Server")
-        driver_quoted = quote_plus(driver)
-        conn_str += f"?driver={driver_quoted}"
-
-        return conn_str
-
-    else:
-        raise JDBCConnectionError(f"Unsupported database type: {conn_type}")
+    driver = conn_details.get("additional_params", {}).get("driver")
+    if isinstance(driver, list):
+        # parse_qs wraps query values in lists; last value wins
+        driver = driver[-1] if driver else None
+
+    return _sqla_url(
+        conn_details.get("connection_type", ""),
+        conn_details.get("host", ""),
+        conn_details.get("port", ""),
+        conn_details.get("database", ""),
+        conn_details.get("user", ""),
+        conn_details.get("password", ""),
+        driver,
+    )
@@ -5,10 +5,107 @@ This module provides functions to interact with databases, such as listing schem
 tables, and querying data using Polars.
 """
 
-from typing import Any, Dict, List, Optional
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 import polars as pl
-from sqlalchemy import inspect, text
+from sqlalchemy import inspect, select, text
+
+from .core import get_sqlalchemy_url
+
+# Default rows fetched per round-trip by the read/iter functions.
+# Overridable via the PJT_DEFAULT_BATCH_SIZE environment variable; larger
+# batches amortize per-round-trip overhead, though PostgreSQL tends to
+# plateau well below this, so tune per database if needed.
+DEFAULT_BATCH_SIZE = int(os.environ.get("PJT_DEFAULT_BATCH_SIZE", 50_000))
+
+# TTL (in seconds) for cached reflection results (schema/table/column names).
+# Overridable via the PJT_METADATA_CACHE_TTL environment variable.
+METADATA_CACHE_TTL = int(os.environ.get("PJT_METADATA_CACHE_TTL", 60))
+
+# Per-engine caches; WeakKeyDictionary so disposed engines are collected
+_inspector_cache: "WeakKeyDictionary" = WeakKeyDictionary()
+_reflection_cache: "WeakKeyDictionary" = WeakKeyDictionary()
+
+# System-schema filters and default schemas, keyed by dialect name.
+# PostgreSQL/Redshift system schemas are matched by prefix; SQL Server's by
+# exact name (frozenset for O(1) membership).
+_PG_SYSTEM_PREFIXES = ("pg_", "information_schema")
+_MSSQL_SYSTEM_SCHEMAS = frozenset(
+    {
+        "sys",
+        "INFORMATION_SCHEMA",
+        "db_accessadmin",
+        "db_backupoperator",
+        "db_datareader",
+        "db_datawriter",
+        "db_ddladmin",
+        "db_denydatareader",
+        "db_denydatawriter",
+        "db_owner",
+        "db_securityadmin",
+        "guest",
+    }
+)
+_DEFAULT_SCHEMA = {"postgresql": "public", "redshift": "public", "mssql": "dbo"}
+
+# Dialects where information_schema.tables is available, letting list_tables
+# fetch tables and views with one filtered query instead of two reflection
+# round-trips
+_INFORMATION_SCHEMA_DIALECTS = frozenset({"postgresql", "redshift", "mssql"})
+
+
+_dialect_names: "WeakKeyDictionary" = WeakKeyDictionary()
+
+
+def _dialect_name(engine) -> str:
+    """Return the engine's dialect name, cached per engine."""
+    name = _dialect_names.get(engine)
+    if name is None:
+        name = _dialect_names[engine] = engine.dialect.name
+    return name
+
+
+def _inspector(engine):
+    """Return a cached Inspector for an engine, creating it on first use."""
+    inspector = _inspector_cache.get(engine)
+    if inspector is None:
+        inspector = _inspector_cache[engine] = inspect(engine)
+    return inspector
+
+
+def _cached_reflection(engine, key: Tuple, fetch: Callable[[], Any]) -> Any:
+    """Serve a reflection result from the per-engine TTL cache, fetching on miss."""
+    cache = _reflection_cache.get(engine)
+    if cache is None:
+        cache = _reflection_cache[engine] = {}
+    entry = cache.get(key)
+    now = time.monotonic()
+    if entry is not None and now - entry[1] < METADATA_CACHE_TTL:
+        return entry[0]
+    value = fetch()
+    cache[key] = (value, now)
+    return value
+
+
+def invalidate_metadata_cache(engine=None) -> None:
+    """
+    Drop cached reflection results.
+
+    Args:
+        engine: Engine whose cache should be cleared. If None, clears the
+            caches for all engines.
+    """
+    if engine is None:
+        _inspector_cache.clear()
+        _reflection_cache.clear()
+    else:
+        _inspector_cache.pop(engine, None)
+        _reflection_cache.pop(engine, None)
 
 
 def list_schemas(engine, exclude_system=True) -> List[str]:
@@ -22,39 +119,51 @@ def list_schemas(engine, exclude_system=True) -> List[str]:
     Returns:
         List[str]: List of schema names
     """
-    inspector = inspect(engine)
-    schemas = inspector.get_schema_names()
+    inspector = _inspector(engine)
+    # Copy so in-place caller mutation can't corrupt the cached list
+    schemas = list(
+        _cached_reflection(engine, ("schema_names",), inspector.get_schema_names)
+    )
 
     if exclude_system:
-        # Filter out system schemas based on database type
-        conn_url = str(engine.url)
-        if "postgresql" in conn_url or "redshift" in conn_url:
+        # Filter out system schemas based on dialect
+        dialect = _dialect_name(engine)
+        if dialect in ("postgresql", "redshift"):
             # PostgreSQL and Redshift system schemas typically start with pg_, information_schema, etc.
-            schemas = [
-                s for s in schemas if not s.startswith(("pg_", "information_schema"))
-            ]
-        elif "mssql" in conn_url:
-            # SQL Server system schemas
-            system_schemas = [
-                "sys",
-                "INFORMATION_SCHEMA",
-                "db_accessadmin",
-                "db_backupoperator",
-                "db_datareader",
-                "db_datawriter",
-                "db_ddladmin",
-                "db_denydatareader",
-                "db_denydatawriter",
-                "db_owner",
-                "db_securityadmin",
-                "guest",
-            ]
-            schemas = [s for s in schemas if s not in system_schemas]
+            schemas = [s for s in schemas if not s.startswith(_PG_SYSTEM_PREFIXES)]
+        elif dialect == "mssql":
+            schemas = [s for s in schemas if s not in _MSSQL_SYSTEM_SCHEMAS]
 
     return schemas
 
 
-def list_tables(engine, schema=None, exclude_views=False) -> List[str]:
+def _query_table_names(engine, schema: str, exclude_views: bool) -> List[str]:
+    """Fetch table (and view) names with one catalog query.
+
+    Does the BASE TABLE/VIEW filtering in the WHERE clause instead of
+    reflecting tables and views separately and merging client-side.
+    """
+    if _dialect_name(engine) == "mssql":
+        # sys.tables/sys.views avoid INFORMATION_SCHEMA's per-row collation
+        # lookups on SQL Server
+        sql = "SELECT name FROM sys.tables WHERE SCHEMA_NAME(schema_id) = :s"
+        if not exclude_views:
+            sql += (
+                " UNION ALL"
+                " SELECT name FROM sys.views WHERE SCHEMA_NAME(schema_id) = :s"
+            )
+    else:
+        sql = (
+            "SELECT table_name FROM information_schema.tables"
+            " WHERE table_schema = :s AND table_type "
+        )
+        sql += "= 'BASE TABLE'" if exclude_views else "IN ('BASE TABLE', 'VIEW')"
+
+    with engine.connect() as conn:
+        return list(conn.execute(text(sql), {"s": schema}).scalars())
+
+
+def list_tables(engine, schema=None, exclude_views=False, parallel=False) -> List[str]:
     """
     List all tables in a schema.
 
@@ -62,28 +171,65 @@ def list_tables(engine, schema=None, exclude_views=False) -> List[str]:
         engine: SQLAlchemy engine
         schema (str, optional): Schema name. If None, uses default schema.
         exclude_views (bool): Whether to exclude views
+        parallel (bool): Whether to fetch table and view names concurrently
+            on dialects that need separate table and view reflection
+            round-trips. Opt-in: only enable for engines whose pool is
+            shareable across threads (in-memory SQLite, for one, gives each
+            thread its own empty database)
 
     Returns:
         List[str]: List of table names
     """
-    inspector = inspect(engine)
+    inspector = _inspector(engine)
 
     if schema is None:
-        # Determine default schema based on database type
-        conn_url = str(engine.url)
-        if "postgresql" in conn_url or "redshift" in conn_url:
-            schema = "public"
-        elif "mssql" in conn_url:
-            schema = "dbo"
+        # Determine default schema based on dialect
+        schema = _DEFAULT_SCHEMA.get(_dialect_name(engine))
+
+    if _dialect_name(engine) in _INFORMATION_SCHEMA_DIALECTS and schema is not None:
+        # Single round-trip with the view filter pushed into the query
+        return list(
+            _cached_reflection(
+                engine,
+                ("tables_query", schema, exclude_views),
+                lambda: _query_table_names(engine, schema, exclude_views),
+            )
+        )
 
     if exclude_views:
-        # Get only tables
-        return inspector.get_table_names(schema)
-    else:
-        # Get tables and views
-        tables = inspector.get_table_names(schema)
-        views = inspector.get_view_names(schema)
-        return tables + views
+        # Get only tables (copied so callers can't mutate the cached list)
+        return list(
+            _cached_reflection(
+                engine,
+                ("table_names", schema),
+                lambda: inspector.get_table_names(schema),
+            )
+        )
+
+    # Get tables and views, overlapping the two reflection round-trips
+    if parallel:
+        with ThreadPoolExecutor(2) as ex:
+            ft = ex.submit(
+                _cached_reflection,
+                engine,
+                ("table_names", schema),
+                lambda: inspector.get_table_names(schema),
+            )
+            fv = ex.submit(
+                _cached_reflection,
+                engine,
+                ("view_names", schema),
+                lambda: inspector.get_view_names(schema),
+            )
+            return list(chain(ft.result(), fv.result()))
+
+    tables = _cached_reflection(
+        engine, ("table_names", schema), lambda: inspector.get_table_names(schema)
+    )
+    views = _cached_reflection(
+        engine, ("view_names", schema), lambda: inspector.get_view_names(schema)
+    )
+    return list(chain(tables, views))
 
 
 def get_table_schema(
@@ -100,8 +246,83 @@ def get_table_schema(
     Returns:
         List[Dict]: List of column information dictionaries
     """
-    inspector = inspect(engine)
-    return inspector.get_columns(table_name, schema)
+    inspector = _inspector(engine)
+    # Copy so in-place caller mutation can't corrupt the cached list
+    return list(
+        _cached_reflection(
+            engine,
+            ("columns", schema, table_name),
+            lambda: inspector.get_columns(table_name, schema),
+        )
+    )
+
+
+def prefetch_table_schemas(
+    engine, schema: Optional[str] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Reflect every table in a schema in one batched pass.
+
+    Uses the inspector's multi-table reflection (one round-trip per pass
+    instead of one per table) and primes the per-engine cache, so
+    subsequent get_table_schema/get_many_table_schemas calls within the
+    cache TTL are served without touching the database.
+
+    Args:
+        engine: SQLAlchemy engine
+        schema (str, optional): Schema name. If None, uses default schema.
+
+    Returns:
+        Dict[str, List[Dict]]: Mapping of table name to its column information
+    """
+    inspector = _inspector(engine)
+    multi = inspector.get_multi_columns(schema=schema)
+
+    now = time.monotonic()
+    cache = _reflection_cache.get(engine)
+    if cache is None:
+        cache = _reflection_cache[engine] = {}
+
+    result = {}
+    for (_, table_name), columns in multi.items():
+        # Return a copy so caller mutation can't corrupt the cached list
+        result[table_name] = list(columns)
+        cache[("columns", schema, table_name)] = (columns, now)
+    return result
+
+
+def get_many_table_schemas(
+    engine,
+    tables: List[str],
+    schema: Optional[str] = None,
+    max_workers: int = 8,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Get schema information for several tables, overlapping the round-trips.
+
+    Reflection is I/O-bound, so the per-table get_columns calls are issued
+    from a thread pool (the engine pool is thread-safe). Results go through
+    the same per-engine cache as get_table_schema, so subsequent single-table
+    lookups are served without a round-trip.
+
+    Args:
+        engine: SQLAlchemy engine
+        tables (List[str]): Table names to introspect
+        schema (str, optional): Schema name. If None, uses default schema.
+        max_workers (int): Maximum number of concurrent reflection calls
+
+    Returns:
+        Dict[str, List[Dict]]: Mapping of table name to its column information
+    """
+    if not tables:
+        return {}
+
+    with ThreadPoolExecutor(min(max_workers, len(tables))) as ex:
+        futures = {
+            table: ex.submit(get_table_schema, engine, table, schema)
+            for table in tables
+        }
+        return {table: future.result() for table, future in futures.items()}
 
 
 def get_table_sample(
@@ -119,10 +340,56 @@ def get_table_sample(
     Returns:
         pl.DataFrame: Polars DataFrame containing sample data
     """
-    qualified_table = f"{schema}.{table_name}" if schema else table_name
-    query = f"SELECT * FROM {qualified_table} LIMIT {limit}"
+    qualified_table = _quote_table(engine, table_name, schema)
 
-    return pl.read_database(query=query, connection=engine)
+    # Let the dialect compiler emit the right row-limiting clause
+    # (LIMIT on PostgreSQL/Redshift, TOP on MSSQL) so the server always
+    # does the truncation
+    stmt = select(text("*")).select_from(text(qualified_table)).limit(int(limit))
+
+    return pl.read_database(query=stmt, connection=engine)
+
+
+def _quote_table(engine, table_name: str, schema: Optional[str] = None) -> str:
+    """Return the dialect-quoted (and schema-qualified) table identifier."""
+    preparer = engine.dialect.identifier_preparer
+    if schema:
+        return f"{preparer.quote_schema(schema)}.{preparer.quote(table_name)}"
+    return preparer.quote(table_name)
+
+
+def _build_select_query(
+    engine,
+    table_name: str,
+    schema: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[str] = None,
+) -> str:
+    """Build a SELECT query with dialect-quoted table and column identifiers.
+
+    ``engine`` may also be a URI string, in which case identifiers are used
+    as given (no dialect available to quote them). ``filters`` is trusted
+    SQL and is appended verbatim after WHERE.
+    """
+    if isinstance(engine, str):
+        qualified_table = f"{schema}.{table_name}" if schema else table_name
+        column_clause = ", ".join(columns) if columns else "*"
+        if filters:
+            return f"SELECT {column_clause} FROM {qualified_table} WHERE {filters}"
+        return f"SELECT {column_clause} FROM {qualified_table}"
+
+    qualified_table = _quote_table(engine, table_name, schema)
+
+    # Handle column selection
+    column_clause = "*"
+    if columns:
+        preparer = engine.dialect.identifier_preparer
+        column_clause = ", ".join(preparer.quote(c) for c in columns)
+
+    # Build query with or without filters
+    if filters:
+        return f"SELECT {column_clause} FROM {qualified_table} WHERE {filters}"
+    return f"SELECT {column_clause} FROM {qualified_table}"
 
 
 def read_table(
@@ -131,57 +398,130 @@ def read_table(
     schema: Optional[str] = None,
     columns: Optional[List[str]] = None,
     filters: Optional[str] = None,
-    batch_size: int = 10000,
-) -> pl.DataFrame:
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    lazy: bool = False,
+):
     """
     Read a table into a Polars DataFrame.
 
+    Push projections and row filters into the database via the columns and
+    filters arguments — that is what actually reduces bytes on the wire.
+    With lazy=True the result is returned as a pl.LazyFrame so further
+    .select()/.filter() chains are optimized by Polars before any derived
+    result is materialized.
+
     Args:
-        engine: SQLAlchemy engine
+        engine: SQLAlchemy engine, or a database URI string. URIs are read
+            through pl.read_database_uri's connectorx engine (Arrow-native
+            transport, typically much faster for large result sets);
+            requires the connectorx extra.
         table_name (str): Table name
         schema (str, optional): Schema name. If None, uses default schema.
         columns (List[str], optional): List of column names to select. If None, selects all columns.
         filters (str, optional): SQL WHERE clause filters (without the 'WHERE' keyword)
-        batch_size (int): Batch size for reading data
+        batch_size (int): Number of rows fetched from the server per round-trip.
+            This is a fetch size, not a row limit; the full result is returned.
+        lazy (bool): If True, return a pl.LazyFrame instead of a DataFrame.
 
     Returns:
-        pl.DataFrame: Polars DataFrame containing the data
+        pl.DataFrame or pl.LazyFrame: The table data
     """
-    # Build query
-    qualified_table = f"{schema}.{table_name}" if schema else table_name
+    query = _build_select_query(engine, table_name, schema, columns, filters)
 
-    # Handle column selection
-    column_clause = "*"
-    if columns:
-        column_clause = ", ".join(columns)
-
-    # Build query with or without filters
-    if filters:
-        query = f"SELECT {column_clause} FROM {qualified_table} WHERE {filters}"
-    else:
-        query = f"SELECT {column_clause} FROM {qualified_table}"
+    if isinstance(engine, str):
+        df = pl.read_database_uri(query=query, uri=engine, engine="connectorx")
+        return df.lazy() if lazy else df
 
-    # Use Polars to read the database
-    return pl.read_database(query=query, connection=engine, batch_size=batch_size)
+    # Stream the result server-side so memory stays bounded by batch_size
+    with engine.connect().execution_options(
+        stream_results=True, yield_per=batch_size
+    ) as conn:
+        df = pl.read_database(query=query, connection=conn, batch_size=batch_size)
+    return df.lazy() if lazy else df
 
 
-def execute_query(engine, query: str, batch_size: int = 10000) -> pl.DataFrame:
+def execute_query(engine, query: str, batch_size: int = DEFAULT_BATCH_SIZE) -> pl.DataFrame:
     """
     Execute a SQL query and return results as a Polars DataFrame.
 
     Args:
-        engine: SQLAlchemy engine
+        engine: SQLAlchemy engine, or a database URI string. URIs are read
+            through pl.read_database_uri's connectorx engine (Arrow-native
+            transport, typically much faster for large result sets);
+            requires the connectorx extra.
         query (str): SQL query to execute
-        batch_size (int): Batch size for reading data
+        batch_size (int): Number of rows fetched from the server per round-trip.
+            This is a fetch size, not a row limit; the full result is returned.
 
     Returns:
         pl.DataFrame: Polars DataFrame containing the results
     """
-    return pl.read_database(query=query, connection=engine, batch_size=batch_size)
+    if isinstance(engine, str):
+        return pl.read_database_uri(query=query, uri=engine, engine="connectorx")
+
+    with engine.connect().execution_options(
+        stream_results=True, yield_per=batch_size
+    ) as conn:
+        return pl.read_database(query=query, connection=conn, batch_size=batch_size)
+
+
+def iter_query(engine, query: str, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[pl.DataFrame]:
+    """
+    Execute a SQL query and yield results as batches of Polars DataFrames.
+
+    Unlike execute_query, the full result is never materialized: batches
+    are yielded as they arrive from the server, so memory stays bounded by
+    batch_size and downstream sinks can start before the query finishes.
+
+    Args:
+        engine: SQLAlchemy engine
+        query (str): SQL query to execute
+        batch_size (int): Number of rows per yielded DataFrame
+
+    Yields:
+        pl.DataFrame: Successive batches of query results
+    """
+    conn = engine.connect().execution_options(
+        stream_results=True, yield_per=batch_size
+    )
+    try:
+        yield from pl.read_database(
+            query=query, connection=conn, iter_batches=True, batch_size=batch_size
+        )
+    finally:
+        conn.close()
+
+
+def iter_table(
+    engine,
+    table_name: str,
+    schema: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[pl.DataFrame]:
+    """
+    Read a table as a stream of Polars DataFrame batches.
+
+    Streaming variant of read_table for tables that don't fit in RAM.
+
+    Args:
+        engine: SQLAlchemy engine
+        table_name (str): Table name
+        schema (str, optional): Schema name. If None, uses default schema.
+        columns (List[str], optional): List of column names to select. If None, selects all columns.
+        filters (str, optional): SQL WHERE clause filters (without the 'WHERE' keyword)
+        batch_size (int): Number of rows per yielded DataFrame
+
+    Yields:
+        pl.DataFrame: Successive batches of table data
+    """
+    query = _build_select_query(engine, table_name, schema, columns, filters)
+    yield from iter_query(engine, query, batch_size=batch_size)
 
 
 def get_table_stats(
-    engine, table_name: str, schema: Optional[str] = None
+    engine, table_name: str, schema: Optional[str] = None, approximate: bool = True
 ) -> Dict[str, Any]:
     """
     Get basic statistics about a table.
@@ -190,34 +530,96 @@ def get_table_stats(
         engine: SQLAlchemy engine
         table_name (str): Table name
         schema (str, optional): Schema name. If None, uses default schema.
+        approximate (bool): If True (default), use catalog statistics for the
+            row count where the dialect supports it (pg_class.reltuples on
+            PostgreSQL, sys.dm_db_partition_stats on SQL Server), avoiding a
+            full COUNT(*) scan. The estimate can lag until the table is
+            analyzed; pass False for an exact count.
 
     Returns:
         Dict[str, Any]: Dictionary containing table statistics
     """
-    qualified_table = f"{schema}.{table_name}" if schema else table_name
+    qualified_table = _quote_table(engine, table_name, schema)
 
     # Get column information
     columns = get_table_schema(engine, table_name, schema)
 
-    # Get row count
-    with engine.connect() as conn:
-        count_query = f"SELECT COUNT(*) FROM {qualified_table}"
-        row_count = conn.execute(text(count_query)).scalar()
-
-    # Get table size info if possible (database specific)
+    row_count = None
     size_info = {}
-    conn_url = str(engine.url)
+    dialect = _dialect_name(engine)
 
-    try:
-        if "postgresql" in conn_url:
-            # PostgreSQL size query
-            size_query = f"""
-                SELECT pg_size_pretty(pg_total_relation_size('{qualified_table}')) as total_size,
-                       pg_size_pretty(pg_relation_size('{qualified_table}')) as table_size,
-                       pg_size_pretty(pg_total_relation_size('{qualified_table}') - pg_relation_size('{qualified_table}')) as index_size
-            """
-            with engine.connect() as conn:
-                result = conn.execute(text(size_query)).fetchone()
+    # Run count and size queries on one connection to avoid a second pool
+    # checkout (and its session-init round-trips)
+    with engine.connect() as conn:
+        if approximate:
+            try:
+                if dialect == "postgresql":
+                    # Single catalog lookup: approximate rows + all three
+                    # sizes in one round-trip, no heap scan
+                    approx_query = """
+                        SELECT CAST(c.reltuples AS BIGINT) as approx_rows,
+                               pg_size_pretty(pg_total_relation_size(c.oid))
+                                   as total_size,
+                               pg_size_pretty(pg_relation_size(c.oid))
+                                   as table_size,
+                               pg_size_pretty(pg_total_relation_size(c.oid)
+                                   - pg_relation_size(c.oid)) as index_size
+                        FROM pg_class c
+                        WHERE c.oid = to_regclass(:t)
+                    """
+                    result = conn.execute(
+                        text(approx_query), {"t": qualified_table}
+                    ).fetchone()
+                    # reltuples is negative when the table was never analyzed
+                    if result and result[0] is not None and result[0] >= 0:
+                        row_count = result[0]
+                        size_info = {
+                            "total_size": result[1],
+                            "table_size": result[2],
+                            "index_size": result[3],
+                        }
+
+                elif dialect == "mssql":
+                    # Partition-stats lookup instead of a heap scan
+                    approx_query = """
+                        SELECT SUM(row_count) as approx_rows
+                        FROM sys.dm_db_partition_stats
+                        WHERE object_id = OBJECT_ID(:t) AND index_id IN (0, 1)
+                    """
+                    result = conn.execute(
+                        text(approx_query), {"t": qualified_table}
+                    ).fetchone()
+                    if result and result[0] is not None:
+                        row_count = result[0]
+            except Exception:
+                # A failed statement dooms the auto-begun transaction on
+                # PostgreSQL-protocol backends (Redshift engines report the
+                # postgresql dialect and reject the pg_* catalog functions),
+                # so roll back before the exact count runs on this connection
+                conn.rollback()
+                row_count = None
+
+        if row_count is None:
+            # Get exact row count
+            count_query = f"SELECT COUNT(*) FROM {qualified_table}"
+            row_count = conn.execute(text(count_query)).scalar()
+
+        # Get table size info if possible (database specific)
+        try:
+            if not size_info and dialect == "postgresql":
+                # PostgreSQL size query; the table name is passed as a bound
+                # parameter so the server can cache one plan across tables
+                size_query = """
+                    SELECT pg_size_pretty(pg_total_relation_size(CAST(:t AS regclass)))
+                               as total_size,
+                           pg_size_pretty(pg_relation_size(CAST(:t AS regclass)))
+                               as table_size,
+                           pg_size_pretty(pg_total_relation_size(CAST(:t AS regclass))
+                               - pg_relation_size(CAST(:t AS regclass))) as index_size
+                """
+                result = conn.execute(
+                    text(size_query), {"t": qualified_table}
+                ).fetchone()
                 if result:
                     size_info = {
                         "total_size": result[0],
@@ -225,22 +627,24 @@ def get_table_stats(
                         "index_size": result[2],
                     }
 
-        elif "redshift" in conn_url:
-            # Redshift size query
-            size_query = f"""
-                SELECT COUNT(*) as row_count,
-                       SUM(encoded_block_size)/(1024*1024) as size_mb
-                FROM stv_blocklist b, stv_tbl_perm p
-                WHERE b.tbl = p.id AND p.name = '{table_name}'
-                  AND p.schema = '{schema or 'public'}'
-            """
-            with engine.connect() as conn:
-                result = conn.execute(text(size_query)).fetchone()
+            elif dialect == "redshift":
+                # Redshift size query
+                size_query = """
+                    SELECT COUNT(*) as row_count,
+                           SUM(encoded_block_size)/(1024*1024) as size_mb
+                    FROM stv_blocklist b, stv_tbl_perm p
+                    WHERE b.tbl = p.id AND p.name = :t
+                      AND p.schema = :s
+                """
+                result = conn.execute(
+                    text(size_query), {"t": table_name, "s": schema or "public"}
+                ).fetchone()
                 if result:
                     size_info = {"size_mb": result[1]}
-    except Exception:
-        # If size query fails, continue without size info
-        pass
+        except Exception:
+            # If size query fails, continue without size info; roll back so
+            # the connection goes back to the pool in a clean state
+            conn.rollback()
 
     # Return combined stats
     return {
@@ -257,7 +661,7 @@ def read_sql_with_polars(
     connection_name: str,
     query: str,
     region_name: Optional[str] = None,
-    batch_size: int = 10000,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> pl.DataFrame:
     """
     Convenience function to read SQL directly using a Glue connection name.
@@ -275,3 +679,54 @@ def read_sql_with_polars(
 
     engine = get_engine_from_glue(connection_name, region_name)
     return pl.read_database(query=query, connection=engine, batch_size=batch_size)
+
+
+def read_sql_fast(
+    connection_name: str,
+    query: str,
+    region_name: Optional[str] = None,
+    partition_on: Optional[str] = None,
+    partition_num: int = 4,
+) -> pl.DataFrame:
+    """
+    Read SQL via a Glue connection using Arrow-native transport.
+
+    Routes the query through pl.read_database_uri with the connectorx
+    engine, which streams results directly into Arrow buffers and can
+    partition the scan across connections — typically several times
+    faster than the row-by-row SQLAlchemy path for large result sets.
+    Falls back to read_sql_with_polars when connectorx is not installed.
+
+    Args:
+        connection_name (str): Glue connection name
+        query (str): SQL query to execute
+        region_name (str, optional): AWS region name
+        partition_on (str, optional): Numeric column to range-partition the
+            query on, enabling parallel fetches
+        partition_num (int): Number of partitions (and connections) to use
+            when partition_on is given
+
+    Returns:
+        pl.DataFrame: Polars DataFrame containing query results
+    """
+    from .aws import extract_jdbc_from_glue
+
+    conn_details = extract_jdbc_from_glue(connection_name, region_name)
+    uri = get_sqlalchemy_url(conn_details)
+
+    # connectorx expects bare schemes (postgresql://, mssql://), so strip
+    # any SQLAlchemy driver suffix like +psycopg2 or +pyodbc
+    scheme, sep, rest = uri.partition("://")
+    uri = scheme.partition("+")[0] + sep + rest
+
+    try:
+        return pl.read_database_uri(
+            query=query,
+            uri=uri,
+            engine="connectorx",
+            partition_on=partition_on,
+            partition_num=partition_num if partition_on else None,
+        )
+    except (ImportError, ModuleNotFoundError):
+        # connectorx not installed; fall back to the SQLAlchemy path
+        return read_sql_with_polars(connection_name, query, region_name)
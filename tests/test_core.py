@@ -26,6 +26,14 @@ class TestParseJdbcUrl:
         assert result["port"] == 5432  # Default PostgreSQL port
         assert result["database"] == "mydb"
 
+    def test_postgresql_url_query_params(self):
+        url = "jdbc:postgresql://myhost.example.com:5432/mydb?sslmode=require&ApplicationName=pjt"
+        result = parse_jdbc_url(url)
+
+        # Values are flat strings, not single-element lists
+        assert result["additional_params"]["sslmode"] == "require"
+        assert result["additional_params"]["ApplicationName"] == "pjt"
+
     def test_redshift_url(self):
         url = "jdbc:redshift://myhost.example.com:5439/mydb"
         result = parse_jdbc_url(url)
@@ -54,6 +62,33 @@ class TestParseJdbcUrl:
         assert result["port"] == 1433  # Default SQL Server port
         assert result["database"] == "mydb"
 
+    def test_attribute_access(self):
+        url = "jdbc:postgresql://myhost.example.com:5432/mydb"
+        result = parse_jdbc_url(url)
+
+        assert result.connection_type == "postgresql"
+        assert result.host == "myhost.example.com"
+        assert result.port == 5432
+        assert result.database == "mydb"
+
+        result.user = "someone"
+        assert result["user"] == "someone"
+
+    def test_repeated_calls_return_independent_dicts(self):
+        url = "jdbc:postgresql://myhost.example.com:5432/mydb"
+        first = parse_jdbc_url(url)
+        first["user"] = "someone"
+        first["additional_params"]["extra"] = "value"
+
+        second = parse_jdbc_url(url)
+        assert "user" not in second
+        assert "extra" not in second["additional_params"]
+
+    def test_invalid_port(self):
+        url = "jdbc:postgresql://myhost.example.com:notaport/mydb"
+        with pytest.raises(JDBCConnectionError):
+            parse_jdbc_url(url)
+
     def test_invalid_url_format(self):
         url = "invalid:url"
         with pytest.raises(JDBCConnectionError):